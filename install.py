@@ -3,36 +3,36 @@ import os
 import shutil
 import traceback
 
-from ffmpeg_downloader.__main__ import install
-
 from src.client.config import Config
 from start import main as start
 
+_INSTALL_ARGS = dict(
+    proxy=None,
+    retries=5,
+    timeout=15,
+    no_cache_dir=False,
+    force=False,
+    upgrade=True,
+    y=True,
+    add_path=False,
+    no_simlinks=False,
+    set_env=None,
+    reset_env=False,
+    presets=None,
+    version=None,
+)
+
 
 def check_ffmpeg():
     return shutil.which("ffmpeg")
 
 
 def install_ffmpeg():
+    # imported here, ffmpeg_downloader is only needed when ffmpeg is missing
+    from ffmpeg_downloader.__main__ import install
+
     try:
-        install(
-            argparse.Namespace(
-                proxy=None,
-                retries=5,
-                timeout=15,
-                no_cache_dir=False,
-                force=False,
-                upgrade=True,
-                y=True,
-                add_path=False,
-                no_simlinks=False,
-                set_env=None,
-                reset_env=False,
-                presets=None,
-                version=None,
-                func=install,
-            )
-        )
+        install(argparse.Namespace(**_INSTALL_ARGS, func=install))
     except Exception:
         print("Error installing ffmpeg...")
         traceback.print_exc()
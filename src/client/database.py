@@ -2,13 +2,63 @@
 The database module of the bot.
 """
 
+import asyncio
+import functools
+import os
 import traceback
 import uuid
+from collections import deque
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
 import aiosqlite
+import zstandard
+from aiosqlitepool import SQLiteConnectionPool
+
+
+@functools.lru_cache(maxsize=256)
+def _compile(
+    op: str,
+    table: str,
+    columns: tuple[str, ...] = (),
+    where_keys: tuple[str, ...] = (),
+    on_conflict: str = None,
+) -> str:
+    """
+    Build the SQL text of a query, memoized so repeated queries reuse the same string
+    (and hit SQLite's statement cache).
+    This is an internal function and should not be called directly.
+
+    :param op: The kind of the query, one of "select", "insert", "upsert" and "update".
+    :type op: str
+    :param table: The table of the query.
+    :type table: str
+    :param columns: The columns to insert or update.
+    :type columns: tuple[str, ...]
+    :param where_keys: The columns of the where clause.
+    :type where_keys: tuple[str, ...]
+    :param on_conflict: The on conflict clause of an upsert.
+    :type on_conflict: str
+    :return: The SQL text.
+    :rtype: str
+    """
+    placeholders = ", ".join("?" * len(columns))
+    assignments = ", ".join(f"{k} = ?" for k in columns)
+    where = " AND ".join(f"{k} = ?" for k in where_keys)
+    match op:
+        case "select":
+            return f"SELECT * FROM {table} WHERE {where}"
+        case "insert":
+            return f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({placeholders})"
+        case "upsert":
+            return (
+                f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({placeholders}) "
+                f"ON CONFLICT ({on_conflict}) DO UPDATE SET {assignments}"
+            )
+        case "update":
+            return f"UPDATE {table} SET {assignments} WHERE {where}"
+    raise ValueError(f"Unknown query kind: {op}")
 
 
 class Database:
@@ -16,25 +66,66 @@ class Database:
     The database class of the bot.
     """
 
+    # applied once to every new pooled connection
+    PRAGMAS = (
+        "journal_mode=WAL",
+        "synchronous=NORMAL",
+        "temp_store=MEMORY",
+        "mmap_size=268435456",  # 256 MiB
+        "cache_size=-65536",  # 64 MiB
+    )
+    # number of error log IDs generated per os.urandom() call
+    UUID_BATCH_SIZE = 64
+
     def __init__(self, path: str) -> None:
         self.path = path
+        self._pool: SQLiteConnectionPool = None
+        # SQLite allows a single writer at a time, serialize writes instead of hitting SQLITE_BUSY
+        self._write_lock = asyncio.Lock()
+        self._uuids: deque[uuid.UUID] = deque()
+        self._compressor = zstandard.ZstdCompressor(level=3)
+        self._decompressor = zstandard.ZstdDecompressor()
+
+    async def _connect(self) -> aiosqlite.Connection:
+        """
+        Opens a new connection for the connection pool.
+        This is an internal method and should not be called directly.
+
+        :return: The new connection.
+        :rtype: aiosqlite.Connection
+        """
+        conn = await aiosqlite.connect(self.path, cached_statements=256)
+        conn.row_factory = aiosqlite.Row
+        for pragma in self.PRAGMAS:
+            await conn.execute(f"PRAGMA {pragma}")
+        return conn
 
     async def initialize(self) -> None:
         """
         Initializes the database.
         """
         Path(self.path).parent.mkdir(parents=True, exist_ok=True)
-        async with aiosqlite.connect(self.path) as db:
+        self._pool = SQLiteConnectionPool(self._connect)
+        async with self._pool.connection() as db:
             # create error log
             await db.execute(
                 """
                 CREATE TABLE IF NOT EXISTS error_log (
                     id TEXT PRIMARY KEY,
-                    traceback TEXT,
+                    traceback BLOB,
                     timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP
                 )
                 """
             )
+            await db.commit()
+
+    async def close(self) -> None:
+        """
+        Closes the connection pool of the database.
+        """
+        if self._pool is not None:
+            await self._pool.close()
+            self._pool = None
 
     async def _get(self, table: str, where: dict[str, Any], fetch_size: int = 1) -> aiosqlite.Row:
         """
@@ -49,10 +140,9 @@ class Database:
         :return: The configuration of the guild.
         :rtype: aiosqlite.Row
         """
-        async with aiosqlite.connect(self.path) as db:
-            db.row_factory = aiosqlite.Row
+        async with self._pool.connection() as db:
             async with db.execute(
-                f"SELECT * FROM {table} WHERE {' AND '.join(f'{k} = ?' for k in where.keys())}",
+                _compile("select", table, where_keys=(*where.keys(),)),
                 (*where.values(),),
             ) as cursor:
                 if fetch_size == 0:
@@ -73,15 +163,29 @@ class Database:
         :rtype: None
         """
         column = (*data.keys(),)
-        async with aiosqlite.connect(self.path) as db:
-            await db.execute(
-                f"""
-                INSERT INTO {table}
-                    ({', '.join(column)})
-                VALUES
-                    (?{', ?' * (len(column) - 1)})
-                """,
-                (*data.values(),),
+        async with self._write_lock, self._pool.connection() as db:
+            await db.execute(_compile("insert", table, column), (*data.values(),))
+            await db.commit()
+            return
+
+    async def _insert_many(self, table: str, data: list[dict[str, Any]]) -> None:
+        """
+        Inserts multiple rows into the specified table in a single transaction.
+        Every row must have the same columns.
+
+        :param table: The table to insert the data into.
+        :type table: str
+        :param data: The rows to insert.
+        :type data: list[dict[str, Any]]
+        :return: None
+        :rtype: None
+        """
+        if not data:
+            return
+        column = (*data[0].keys(),)
+        async with self._write_lock, self._pool.connection() as db:
+            await db.executemany(
+                _compile("insert", table, column), [(*row.values(),) for row in data]
             )
             await db.commit()
             return
@@ -104,16 +208,9 @@ class Database:
         :rtype: None
         """
         column = (*where.keys(), *data.keys())
-        async with aiosqlite.connect(self.path) as db:
+        async with self._write_lock, self._pool.connection() as db:
             await db.execute(
-                f"""
-                INSERT INTO {table}
-                    ({', '.join(column)})
-                VALUES
-                    (?{', ?' * (len(column) - 1)})
-                ON CONFLICT ({on_conflict}) DO UPDATE SET
-                    {', '.join(f"{k} = ?" for k in column)}
-                """,
+                _compile("upsert", table, column, on_conflict=on_conflict),
                 (*where.values(), *data.values()) * 2,
             )
             await db.commit()
@@ -133,38 +230,71 @@ class Database:
         :rtype: None
         """
         column = (*data.keys(),)
-        async with aiosqlite.connect(self.path) as db:
+        async with self._write_lock, self._pool.connection() as db:
             await db.execute(
-                f"""
-                UPDATE {table}
-                SET {', '.join(f"{k} = ?" for k in column)}
-                WHERE {' AND '.join(f"{k} = ?" for k in where.keys())}
-                """,
-                (*data.values(), *where.keys()),
+                _compile("update", table, column, (*where.keys(),)),
+                (*data.values(), *where.values()),
             )
             await db.commit()
             return
 
+    def _new_uuid(self) -> uuid.UUID:
+        """
+        Takes a random (version 4) UUID from the pre-generated pool, refilling it when empty.
+        This is an internal method and should not be called directly.
+        """
+        if not self._uuids:
+            raw = os.urandom(16 * self.UUID_BATCH_SIZE)
+            self._uuids.extend(
+                uuid.UUID(bytes=raw[i : i + 16], version=4) for i in range(0, len(raw), 16)
+            )
+        return self._uuids.popleft()
+
+    def _error_log_row(self, err_id: uuid.UUID, exception: str | Exception) -> dict[str, Any]:
+        """
+        Builds a row of the error log table, with the traceback compressed by zstd.
+        This is an internal method and should not be called directly.
+        """
+        tb = (
+            "".join(traceback.format_exception(exception))
+            if issubclass(type(exception), Exception)
+            else exception
+        )
+        return {
+            "id": str(err_id),
+            "traceback": self._compressor.compress(tb.encode("utf-8")),
+            "timestamp": int(datetime.now().timestamp()),
+        }
+
     async def new_error_log(self, exception: str | Exception) -> uuid.UUID:
         """
         Creates a new error log.
         """
-        await self._insert(
+        await self._insert("error_log", self._error_log_row(err_id := self._new_uuid(), exception))
+        return err_id
+
+    async def new_error_logs(self, batch: list[str | Exception]) -> list[uuid.UUID]:
+        """
+        Creates multiple error logs in a single transaction.
+        """
+        err_ids = [self._new_uuid() for _ in batch]
+        await self._insert_many(
             "error_log",
-            {
-                "id": str(err_id := uuid.uuid4()),
-                "traceback": (
-                    "".join(traceback.format_exception(exception))
-                    if issubclass(type(exception), Exception)
-                    else exception
-                ),
-                "timestamp": int(datetime.now().timestamp()),
-            },
+            [self._error_log_row(err_id, exception) for err_id, exception in zip(err_ids, batch)],
         )
-        return err_id
+        return err_ids
 
-    async def get_error_log(self, err_id: str) -> aiosqlite.Row:
+    async def get_error_log(self, err_id: str) -> dict[str, Any] | None:
         """
         Gets the error log.
         """
-        return await self._get("error_log", {"id": err_id})
+        row = await self._get("error_log", {"id": err_id})
+        if row is None:
+            return None
+        err_log = dict(row)
+        # logs written before compression was added are stored as plain text
+        if isinstance(err_log["traceback"], bytes):
+            err_log["traceback"] = self._decompressor.decompress(err_log["traceback"]).decode(
+                "utf-8"
+            )
+        return err_log
@@ -2,6 +2,13 @@
 Internationalization and localization utilities.
 """
 
+import functools
+import hashlib
+import operator
+import os
+import pickle
+from collections import defaultdict
+from pathlib import Path
 from typing import Union
 
 import discord
@@ -9,6 +16,62 @@ from pyi18n import PyI18n
 from pyi18n.loaders import PyI18nYamlLoader
 
 
+class CachedYamlLoader(PyI18nYamlLoader):
+    """
+    A YAML loader that stores the parsed catalogs in a pickle cache file.
+    The cache is keyed by the modification time of every locale file,
+    so editing any of them will parse the YAML files again.
+    """
+
+    cache_dir = Path(".cache")
+
+    def _digest(self, locales: tuple) -> str:
+        """
+        Compute the cache key of the locale files.
+        This is an internal method and should not be called directly.
+
+        :param locales: The locales to load.
+        :type locales: tuple
+
+        :return: The hex digest of the locale files.
+        :rtype: str
+        """
+        sha1 = hashlib.sha1(repr((locales, self.namespaced)).encode())
+        for root, _, files in sorted(os.walk(self.load_path)):
+            for file in sorted(files):
+                stat = os.stat(path := os.path.join(root, file))
+                sha1.update(f"{path}:{stat.st_mtime_ns}:{stat.st_size}".encode())
+        return sha1.hexdigest()
+
+    def load(self, locales: tuple) -> dict:
+        """
+        Load the translations from the cache file, or parse and cache them.
+
+        :param locales: The locales to load.
+        :type locales: tuple
+
+        :return: The loaded translations.
+        :rtype: dict
+        """
+        cache_path = self.cache_dir / f"locales-{self._digest(locales)}.pkl"
+        try:
+            with open(cache_path, "rb") as f:
+                return pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            pass
+
+        loaded = super().load(locales)
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            for old in self.cache_dir.glob("locales-*.pkl"):
+                old.unlink(missing_ok=True)
+            with open(cache_path, "wb") as f:
+                pickle.dump(loaded, f, protocol=pickle.HIGHEST_PROTOCOL)
+        except OSError:
+            pass
+        return loaded
+
+
 class I18n:
     """
     Internationalization and localization class.
@@ -16,9 +79,43 @@ class I18n:
     """
 
     locales = ("en-US", "zh-TW")
-    i18n_instance = PyI18n(locales, loader=PyI18nYamlLoader("locales", namespaced=True))
+    i18n_instance = PyI18n(locales, loader=CachedYamlLoader("locales", namespaced=True))
     i18n_get = i18n_instance.gettext
 
+    @classmethod
+    def get_locale(
+        cls, language: Union[str, discord.ApplicationContext, discord.Interaction]
+    ) -> str:
+        """
+        Resolve the locale to get strings in.
+
+        :param language: The language or the context to resolve the locale from.
+        :type language: str | discord.ApplicationContext
+
+        :return: The resolved locale, "en-US" if it is not available.
+        :rtype: str
+        """
+        if isinstance(language, (discord.ApplicationContext, discord.Interaction)):
+            language = language.locale or language.guild_locale
+        if not isinstance(language, str) or language not in cls.locales:
+            language = "en-US"
+        return language
+
+    @classmethod
+    def context(
+        cls, language: Union[str, discord.ApplicationContext, discord.Interaction]
+    ) -> "Translator":
+        """
+        Get a translator bound to the resolved locale of a language or a context.
+
+        :param language: The language or the context to resolve the locale from.
+        :type language: str | discord.ApplicationContext
+
+        :return: The translator of the locale.
+        :rtype: Translator
+        """
+        return Translator(cls.get_locale(language))
+
     @classmethod
     def get(
         cls,
@@ -39,11 +136,53 @@ class I18n:
         :return: The translated string.
         :rtype: str
         """
-        if isinstance(language, (discord.ApplicationContext, discord.Interaction)):
-            language = language.locale or language.guild_locale
-        if not isinstance(language, str) or language not in cls.locales:
-            language = "en-US"
-        return cls.i18n_get(language, key, **kwargs)
+        if kwargs:
+            return cls._format(cls.get_locale(language), key, kwargs)
+        return cls._get_cached(cls.get_locale(language), key, ())
+
+    @classmethod
+    @functools.lru_cache(maxsize=4096)
+    def _get_cached(cls, language: str, key: str, kwargs_items: tuple) -> str:
+        """
+        Get a translated string, memoized by its arguments.
+        This is an internal method and should not be called directly.
+
+        :param language: The language to get the string in.
+        :type language: str
+        :param key: The key of the string.
+        :type key: str
+        :param kwargs_items: The sorted items of the arguments to format the string with.
+        :type kwargs_items: tuple
+
+        :return: The translated string.
+        :rtype: str
+        """
+        return cls.i18n_get(language, key, **dict(kwargs_items))
+
+    @classmethod
+    def _format(cls, language: str, key: str, kwargs: dict) -> str:
+        """
+        Get a translated string formatted with the arguments, the same way as PyI18n does.
+        The arguments are not part of any cache key, so unique values (like IDs) are fine.
+        This is an internal method and should not be called directly.
+
+        :param language: The language to get the string in.
+        :type language: str
+        :param key: The key of the string.
+        :type key: str
+        :param kwargs: The arguments to format the string with.
+        :type kwargs: dict
+
+        :return: The translated string.
+        :rtype: str
+        """
+        template = cls.resolve(tuple(key.split(".")), language)
+        if not isinstance(template, str):
+            return template
+        try:
+            return template.format_map(defaultdict(str, **kwargs))
+        except KeyError:
+            return template
 
     @classmethod
     def get_all(cls, key: str, **kwargs) -> dict:
@@ -58,7 +197,134 @@ class I18n:
         :return: The translated strings.
         :rtype: dict
         """
-        return {locale: cls.get(key, locale, **kwargs) for locale in cls.locales}
+        return dict(cls._get_all_cached(key, tuple(sorted(kwargs.items()))))
+
+    @classmethod
+    @functools.lru_cache(maxsize=1024)
+    def _get_all_cached(cls, key: str, kwargs_items: tuple) -> dict:
+        """
+        Get all translated strings for a key, memoized by its arguments.
+        This is an internal method and should not be called directly.
+
+        :param key: The key of the string.
+        :type key: str
+        :param kwargs_items: The sorted items of the arguments to format the string with.
+        :type kwargs_items: tuple
+
+        :return: The translated strings.
+        :rtype: dict
+        """
+        if not kwargs_items:
+            # nothing to format, read the loaded catalogs directly
+            path = tuple(key.split("."))
+            return {locale: cls.resolve(path, locale) for locale in cls.locales}
+        return {locale: cls._get_cached(locale, key, kwargs_items) for locale in cls.locales}
+
+    @classmethod
+    @functools.lru_cache(maxsize=1024)
+    def resolve(cls, path: tuple[str, ...], locale: str) -> str:
+        """
+        Get a raw (unformatted) translated string by walking the loaded catalog of a locale.
+
+        :param path: The key of the string, split by ".".
+        :type path: tuple[str, ...]
+        :param locale: The locale of the catalog.
+        :type locale: str
+
+        :return: The raw translated string.
+        :rtype: str
+        """
+        found = cls._lookup(path, locale)
+        if found is None:
+            return f"missing translation for: {locale}.{'.'.join(path)}"
+        return found
+
+    @classmethod
+    def _lookup(cls, path: tuple[str, ...], locale: str) -> Union[str, None]:
+        """
+        Walk the loaded catalog of a locale for a key.
+        This is an internal method and should not be called directly.
+
+        :param path: The key of the string, split by ".".
+        :type path: tuple[str, ...]
+        :param locale: The locale of the catalog.
+        :type locale: str
+
+        :return: The raw translated string, or None if the catalog does not have it.
+        :rtype: str | None
+        """
+        try:
+            return functools.reduce(
+                operator.getitem, path, cls.i18n_instance._loaded_translations[locale]
+            )
+        except (KeyError, TypeError):
+            return None
+
+    @classmethod
+    def bundle(cls, prefix: Union[str, tuple[str, ...]], description: bool = True) -> dict:
+        """
+        Get the localized name and description fields of a command or an option.
+
+        :param prefix: The key prefix of the command or the option, or the prefix split by ".".
+        :type prefix: str | tuple[str, ...]
+        :param description: Whether to include the description fields.
+        :type description: bool
+
+        :return: The keyword arguments for the command or the option.
+        :rtype: dict
+        """
+        if isinstance(prefix, str):
+            prefix = tuple(prefix.split("."))
+        return {
+            field: value.copy() if isinstance(value, dict) else value
+            for field, value in cls._get_bundle(prefix, description).items()
+        }
+
+    @classmethod
+    @functools.lru_cache(maxsize=256)
+    def _get_bundle(cls, prefix_path: tuple[str, ...], description: bool) -> dict:
+        """
+        Build the localized fields of a command or an option, memoized by its prefix.
+        This is an internal method and should not be called directly.
+
+        :param prefix_path: The key prefix of the command or the option, split by ".".
+        :type prefix_path: tuple[str, ...]
+        :param description: Whether to include the description fields.
+        :type description: bool
+
+        :return: The keyword arguments for the command or the option.
+        :rtype: dict
+        """
+        fields = ("name", "description") if description else ("name",)
+        bundle = {}
+        for field in fields:
+            path = (*prefix_path, field)
+            bundle[field] = default = cls.resolve(path, "en-US")
+            # Discord falls back to the default for missing locales, only send the overrides
+            bundle[f"{field}_localizations"] = {
+                locale: value
+                for locale in cls.locales
+                if (value := cls._lookup(path, locale)) is not None and value != default
+            }
+        return bundle
+
+
+class Translator:
+    """
+    Gets translated strings in a single, already resolved locale.
+    Use ``translator[key]`` for plain strings and ``translator(key, **kwargs)`` to format them.
+    """
+
+    __slots__ = ("locale",)
+
+    def __init__(self, locale: str) -> None:
+        self.locale = locale
+
+    def __getitem__(self, key: str) -> str:
+        return I18n._get_cached(self.locale, key, ())
+
+    def __call__(self, key: str, **kwargs) -> str:
+        return I18n._format(self.locale, key, kwargs)
 
 
 # sourcery skip: require-return-annotation
@@ -71,10 +337,7 @@ def slash_command(identifier: str, **kwargs):
     :param identifier: The identifier of the locale for the command.
     :type identifier: str
     """
-    kwargs["name"] = I18n.get(f"slash.{identifier}.name")
-    kwargs["name_localizations"] = I18n.get_all(f"slash.{identifier}.name")
-    kwargs["description"] = I18n.get(f"slash.{identifier}.description")
-    kwargs["description_localizations"] = I18n.get_all(f"slash.{identifier}.description")
+    kwargs.update(I18n.bundle(f"slash.{identifier}"))
     return discord.application_command(cls=discord.SlashCommand, **kwargs)
 
 
@@ -85,8 +348,7 @@ def message_command(identifier: str, **kwargs):
     :param identifier: The identifier of the locale for the command.
     :type identifier: str
     """
-    kwargs["name"] = I18n.get(f"message.{identifier}.name")
-    kwargs["name_localizations"] = I18n.get_all(f"message.{identifier}.name")
+    kwargs.update(I18n.bundle(f"message.{identifier}", description=False))
     return discord.application_command(cls=discord.MessageCommand, **kwargs)
 
 
@@ -97,8 +359,7 @@ def user_command(identifier: str, **kwargs):
     :param identifier: The identifier of the locale for the command.
     :type identifier: str
     """
-    kwargs["name"] = I18n.get(f"user.{identifier}.name")
-    kwargs["name_localizations"] = I18n.get_all(f"user.{identifier}.name")
+    kwargs.update(I18n.bundle(f"user.{identifier}", description=False))
     return discord.application_command(cls=discord.UserCommand, **kwargs)
 
 
@@ -111,12 +372,7 @@ def option(identifier: str, parameter_name: str, **kwargs):
     :param parameter_name: The name of the parameter.
     :type parameter_name: str
     """
-    kwargs["name"] = I18n.get(f"slash.{identifier}.option.{parameter_name}.name")
-    kwargs["name_localizations"] = I18n.get_all(f"slash.{identifier}.option.{parameter_name}.name")
-    kwargs["description"] = I18n.get(f"slash.{identifier}.option.{parameter_name}.description")
-    kwargs["description_localizations"] = I18n.get_all(
-        f"slash.{identifier}.option.{parameter_name}.description"
-    )
+    kwargs.update(I18n.bundle(f"slash.{identifier}.option.{parameter_name}"))
 
     def decorator(func: object):
         func.__annotations__[parameter_name] = discord.Option(
@@ -164,10 +420,8 @@ class SlashCommandGroup(discord.SlashCommandGroup):
         """
         self.identifier = identifier
         self.prefix = f"slash.group.{identifier}"
-        kwargs["name"] = I18n.get(f"{self.prefix}.name")
-        kwargs["name_localizations"] = I18n.get_all(f"{self.prefix}.name")
-        kwargs["description"] = I18n.get(f"{self.prefix}.description")
-        kwargs["description_localizations"] = I18n.get_all(f"{self.prefix}.description")
+        self._prefix_path = tuple(self.prefix.split("."))
+        kwargs.update(I18n.bundle(self._prefix_path))
         return super().__init__(**kwargs)
 
     def command(self, identifier: str, **kwargs):
@@ -177,12 +431,7 @@ class SlashCommandGroup(discord.SlashCommandGroup):
         :param identifier: The identifier of the locale for the command.
         :type identifier: str
         """
-        kwargs["name"] = I18n.get(f"{self.prefix}.{identifier}.name")
-        kwargs["name_localizations"] = I18n.get_all(f"{self.prefix}.{identifier}.name")
-        kwargs["description"] = I18n.get(f"{self.prefix}.{identifier}.description")
-        kwargs["description_localizations"] = I18n.get_all(
-            f"{self.prefix}.{identifier}.description"
-        )
+        kwargs.update(I18n.bundle((*self._prefix_path, *identifier.split("."))))
         return super().command(cls=discord.SlashCommand, **kwargs)
 
     def option(self, identifier: str, parameter_name: str, **kwargs):
@@ -2,13 +2,15 @@
 Provide logging functionality for the bot.
 """
 
-import inspect
+import atexit
 import logging
 import sys
 from datetime import timedelta
 
 from loguru._logger import Core, Logger
 
+_LOGGING_FILE = logging.__file__
+
 
 class Logging:
     """
@@ -39,7 +41,7 @@ class Logging:
         )
         self._logger.disable("discord")
         self._logger.disable("aiosqlite")
-        self._logger.add(sys.stderr, level=level, diagnose=False, enqueue=True, format=format)
+        self._logger.add(sys.stderr, level=level, diagnose=False, enqueue=False, format=format)
         self._logger.add(
             "./logs/{time:YYYY-MM-DD_HH-mm-ss_SSS}.log",
             rotation="00:00",
@@ -49,8 +51,10 @@ class Logging:
             diagnose=False,
             level=level,
             enqueue=True,
+            buffering=65536,  # batch records into fewer writes, flushed on rotation and exit
             format=format,
         )
+        atexit.register(self._logger.remove)
         self._logger.debug(
             f"Logger initialized. Debug mode {'enabled' if debug_mode else 'disabled'}."
         )
@@ -69,17 +73,21 @@ class InterceptHandler(logging.Handler):
     def __init__(self, logger: Logger) -> None:
         super().__init__()
         self.logger = logger
+        self._levels: dict[str, str | int] = {}
 
     def emit(self, record: logging.LogRecord) -> None:
         # Get corresponding Loguru level if it exists.
-        level: str | int
-        try:
-            level = self.logger.level(record.levelname).name
-        except ValueError:
-            level = record.levelno
+        level: str | int | None = self._levels.get(record.levelname)
+        if level is None:
+            try:
+                level = self.logger.level(record.levelname).name
+            except ValueError:
+                level = record.levelno
+            self._levels[record.levelname] = level
 
-        frame, depth = inspect.currentframe(), 0
-        while frame and (depth == 0 or frame.f_code.co_filename == logging.__file__):
+        # Find the caller from where the logged message originated.
+        frame, depth = sys._getframe(1), 1
+        while frame and frame.f_code.co_filename == _LOGGING_FILE:
             frame = frame.f_back
             depth += 1
 
@@ -4,7 +4,6 @@ Cog module for the download commands.
 
 import asyncio
 import os
-import subprocess
 
 import discord
 import yt_dlp
@@ -42,31 +41,35 @@ class DownloadCog(BaseCog):
     ):
         await ctx.defer()
 
-        options = {"postprocessors": []}
-        if video_format:
-            options["postprocessors"].append(
-                {"key": "FFmpegVideoConvertor", "preferedformat": video_format}
-            )
-        if video_quality:
-            options["postprocessor_args"] = ["-b:v", f"{video_quality.removesuffix('k')}k"]
-        if audio_format or audio_quality:
-            process = {"key": "FFmpegExtractAudio"}
-            if audio_format:
-                process["preferredcodec"] = audio_format
-            if audio_quality:
-                process["preferredquality"] = audio_quality.removesuffix("k")
-            options["postprocessors"].append(process)
+        if audio_quality:
+            audio_quality = audio_quality.removesuffix("k")
         if audio_only == "true":
+            # the other options are ignored in audio only mode, skip building them
             options = {
                 "format": "bestaudio/best",
                 "postprocessors": [
                     {
                         "key": "FFmpegExtractAudio",
                         "preferredcodec": audio_format or "mp3",
-                        "preferredquality": (audio_quality or "192").removesuffix("k"),
+                        "preferredquality": audio_quality or "192",
                     }
                 ],
             }
+        else:
+            options = {"postprocessors": []}
+            if video_format:
+                options["postprocessors"].append(
+                    {"key": "FFmpegVideoConvertor", "preferedformat": video_format}
+                )
+            if video_quality:
+                options["postprocessor_args"] = ["-b:v", f"{video_quality.removesuffix('k')}k"]
+            if audio_format or audio_quality:
+                process = {"key": "FFmpegExtractAudio"}
+                if audio_format:
+                    process["preferredcodec"] = audio_format
+                if audio_quality:
+                    process["preferredquality"] = audio_quality
+                options["postprocessors"].append(process)
 
         await self._run_handler(ctx, url, options)
 
@@ -74,6 +77,7 @@ class DownloadCog(BaseCog):
 class Downloader:
     def __init__(self, ctx: discord.ApplicationContext, url: str, options: dict[str, str] = None):
         self.ctx = ctx
+        self._t = I18n.context(ctx)
         self.url = url
         self.options = options or {}
         self.options["outtmpl"] = ".cache/videos/%(title)s.%(ext)s"
@@ -85,57 +89,56 @@ class Downloader:
         self.options["cachedir"] = ".cache/ytdlp"
         self.options["ffmpeg-location"] = self.bot.ffmpeg
         self.file_path = None
+        self.duration = None
+        self.bitrate = None
 
     def _hook(self, d):
         if d["status"] == "finished":
-            self.file_path = d.get("filename") or d["info_dict"].get("filepath")
+            info_dict = d["info_dict"]
+            self.file_path = d.get("filename") or info_dict.get("filepath")
+            self.duration = info_dict.get("duration") or self.duration
+            if info_dict.get("tbr"):  # in kbps
+                self.bitrate = info_dict["tbr"] * 1000
 
     async def _download(self):
         with yt_dlp.YoutubeDL(self.options) as ydl:
             await (self.bot.loop or asyncio.get_event_loop()).run_in_executor(
-                None, lambda: ydl.download([self.url])
+                self.bot.ytdlp_executor, ydl.download, [self.url]
             )
 
     async def run(self):
-        await self.ctx.respond(I18n.get("slash.download.response.start", self.ctx))
+        # send the start message while the download is already running
+        respond = asyncio.create_task(self.ctx.respond(self._t["slash.download.response.start"]))
         try:
             await self._download()
-            size_in_bytes = os.path.getsize(self.file_path)
+            size_in_bytes = await asyncio.to_thread(os.path.getsize, self.file_path)
+            await respond  # the edits below must not be overwritten by the start message
             if size_in_bytes > 25000000:  # 25MB
-                process = subprocess.run(
-                    [
-                        # fmt: off
-                        self.bot.ffprobe,
-                        "-v", "quiet",
-                        "-show_entries", "format=bit_rate",
-                        "-of", "default=noprint_wrappers=1:nokey=1",
-                        self.file_path,
-                        # fmt: on
-                    ],
-                    stderr=subprocess.PIPE,
-                    stdout=subprocess.PIPE,
-                )
-                bitrate = int(process.stdout)
+                # same as ffprobe's format=bit_rate, falls back to the bitrate reported by yt-dlp
+                bitrate = size_in_bytes * 8 / self.duration if self.duration else self.bitrate or 0
                 await self.ctx.edit(
-                    content=I18n.get(
+                    content=self._t(
                         "slash.download.response.too_large",
-                        self.ctx,
                         size=f"{size_in_bytes/1000000:.2f}MB",
                         bitrate=f"{bitrate/1000:.2f}kbps",
                     )
                 )
             else:
-                await self.ctx.edit(
-                    content=I18n.get("slash.download.response.success", self.ctx),
-                    file=discord.File(self.file_path),
-                )
+                # unbuffered, aiohttp streams it in chunks without an extra buffer copy
+                with open(self.file_path, "rb", buffering=0) as fp:
+                    await self.ctx.edit(
+                        content=self._t["slash.download.response.success"],
+                        file=discord.File(fp, filename=os.path.basename(self.file_path)),
+                    )
         except Exception as e:
             error_id = await self.bot.database.new_error_log(e)
+            await asyncio.gather(respond, return_exceptions=True)
             await self.ctx.edit(
-                content=I18n.get("slash.download.response.error", self.ctx, err_id=str(error_id))
+                content=self._t("slash.download.response.error", err_id=str(error_id))
             )
         finally:
-            os.remove(self.file_path)
+            if self.file_path is not None:
+                await asyncio.to_thread(os.remove, self.file_path)
 
     @property
     def bot(self) -> Bot:
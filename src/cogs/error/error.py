@@ -2,6 +2,7 @@
 Cog module for the error commands.
 """
 
+import functools
 import io
 import uuid
 
@@ -16,31 +17,46 @@ class ErrorCog(BaseCog):
     The cog class for the error commands.
     """
 
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def _responses(cls, locale: str) -> dict[str, str]:
+        """
+        Get the response strings of the error_log command in a locale.
+
+        :param locale: The locale of the responses.
+        :type locale: str
+
+        :return: The response strings, keyed by their name.
+        :rtype: dict[str, str]
+        """
+        return {
+            key: I18n.get(f"slash.error_log.response.{key}", locale)
+            for key in ("no_permission", "invalid_id", "not_found", "success")
+        }
+
     @slash_command("error_log")
     @option("error_log", "err_id")
     async def error_log(self, ctx: discord.ApplicationContext, err_id: str):
         await ctx.defer(ephemeral=True)
+        responses = self._responses(I18n.get_locale(ctx))
 
         if not await self.bot.is_owner(ctx.author):
-            await ctx.respond(I18n.get("slash.error_log.response.no_permission", ctx))
+            await ctx.respond(responses["no_permission"])
             return
 
         try:
             err_uuid = uuid.UUID(err_id)
         except ValueError:
-            await ctx.respond(I18n.get("slash.error_log.response.invalid_id", ctx))
+            await ctx.respond(responses["invalid_id"])
             return
 
         err_log = await self.db.get_error_log(str(err_uuid))
         if err_log is None:
-            await ctx.respond(I18n.get("slash.error_log.response.not_found", ctx))
+            await ctx.respond(responses["not_found"])
             return
 
         traceback: str = err_log["traceback"]
-        msg = (
-            I18n.get("slash.error_log.response.success", ctx)
-            + f"<t:{err_log['timestamp']}:F> (<t:{err_log['timestamp']}:R>)"
-        )
+        msg = responses["success"] + f"<t:{err_log['timestamp']}:F> (<t:{err_log['timestamp']}:R>)"
         if len(msg) + len(traceback) <= 1994:  # 2000 - 6(len of "`"*6)
             await ctx.respond(f"{msg}```{traceback}```")
         else:
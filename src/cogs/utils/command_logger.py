@@ -3,13 +3,28 @@ Cog module for the command logger.
 """
 
 
+import asyncio
+import time
+from typing import Callable, Optional
+
 import aiohttp
 import discord
-from discord.ext import commands, tasks
+from discord.ext import commands
 
 from src.client.i18n import I18n
 from src.main import BaseCog, Bot
 from src.utils.discord import get_user_name
+from src.utils.ratelimit import TokenBucket
+
+# format of a command log line
+_FMT = "{prefix} {user}: ({ctype}-command) {cname}{cargs}"
+# log type and arguments formatter of every application command type, keyed by the type
+_APP_FORMATTERS: dict[int, tuple[str, Callable[[dict], str]]] = {
+    1: ("slash", lambda d: ", ".join([f"{o['name']}: {o['value']}" for o in d.get("options", [])])),
+    2: ("user", lambda d: f"user: {d['target_id']}"),
+    3: ("message", lambda d: f"message: {d['target_id']}"),
+}
+_DEFAULT_APP_FORMATTER: tuple[str, Callable[[dict], str]] = ("application", lambda d: "")
 
 
 class CmdLogger(BaseCog):
@@ -17,9 +32,97 @@ class CmdLogger(BaseCog):
     The cog class for the command logger.
     """
 
-    log_content: str = ""
-    log_buffer: list[str] = []
-    message_id: int = None
+    __slots__ = (
+        "message_id",
+        "_session",
+        "_webhook",
+        "_log_buf",
+        "_sent_len",
+        "_sending_end",
+        "_ch_prefix",
+        "_bucket",
+        "_flush_event",
+        "_first_buffered_at",
+        "_flush_timer",
+        "_flush_task",
+    )
+
+    # wait this long after the latest log for more logs before flushing (seconds)
+    FLUSH_DELAY = 0.05
+    # never delay a log for longer than this since the first buffered one (seconds)
+    FLUSH_MAX_DELAY = 0.1
+    # flush right away once the buffer gets close to the message length limit
+    FLUSH_SIZE = 1500
+    # times to retry a webhook call that hit the rate limit (429)
+    WEBHOOK_RETRIES = 3
+    # drop the oldest logs not sent yet once they take more than this (bytes)
+    BUFFER_LIMIT = 64 * 1024
+
+    def __init__(self, bot: Bot) -> None:
+        super().__init__(bot)
+        self.message_id: Optional[int] = None
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._webhook: Optional[discord.Webhook] = None
+        # content of the current webhook message, followed by the logs not sent yet
+        self._log_buf = bytearray()
+        self._sent_len = 0
+        # end of the content of the webhook call in flight, never dropped
+        self._sending_end = 0
+        # "[guild #channel]" label of every logged channel, keyed by the channel ID
+        self._ch_prefix: dict[int, str] = {}
+        # 5 webhook calls per 2 seconds
+        self._bucket = TokenBucket(rate=5 / 2.0, capacity=5)
+        self._flush_event = asyncio.Event()
+        self._first_buffered_at: Optional[float] = None
+        self._flush_timer: Optional[asyncio.TimerHandle] = None
+        self._flush_task: Optional[asyncio.Task] = None
+        if bot.log_webhook:
+            try:
+                # check the URL before buffering any log, the session is bound by the flusher
+                self._webhook = discord.Webhook.from_url(bot.log_webhook, session=None)
+            except discord.InvalidArgument:
+                self.logger.error("Invalid log webhook URL, command logs are not sent to it")
+            else:
+                # py-cord has no async cog_load, start the flusher once the cog is created instead
+                self._flush_task = bot.loop.create_task(self._flusher())
+
+    def _format_log(
+        self,
+        ctx: commands.Context | discord.ApplicationContext,
+        command_type: str,
+        command_args: str,
+    ) -> str:
+        """
+        Format the log line of a command usage.
+        This is an internal function and should not be called directly.
+
+        :param ctx: The context of the command.
+        :type ctx: commands.Context | discord.ApplicationContext
+        :param command_type: The type of the command.
+        :type command_type: str
+        :param command_args: The arguments of the command.
+        :type command_args: str
+
+        :return: The log line.
+        :rtype: str
+        """
+        command = ctx.command
+        channel = ctx.channel
+        if (prefix := self._ch_prefix.get(channel.id)) is None:
+            prefix = self._ch_prefix[channel.id] = f"[{ctx.guild.name} #{channel.name}]"
+        return _FMT.format_map(
+            {
+                "prefix": prefix,
+                "user": get_user_name(ctx.author),
+                "ctype": command_type,
+                "cname": (
+                    f"{command.full_parent_name} {command.name}"
+                    if command.full_parent_name
+                    else command.name
+                ),
+                "cargs": f" - {command_args}" if command_args else "",
+            }
+        )
 
     async def _log_command(
         self,
@@ -38,47 +141,98 @@ class CmdLogger(BaseCog):
         :param command_args: The arguments of the command.
         :type command_args: str
         """
-        command_name = (
-            f"{ctx.command.full_parent_name} {ctx.command.name}"
-            if ctx.command.full_parent_name
-            else ctx.command.name
-        )
-        command_args = f" - {command_args}" if command_args else ""
-        msg = (
-            f"[{ctx.guild.name} #{ctx.channel.name}] {get_user_name(ctx.author)}: "
-            f"({command_type}-command) {command_name}{command_args}"
-        )
+        if self._webhook is None:
+            # terminal log only, the line is not built unless a sink accepts it
+            self.bot.logger.opt(lazy=True).info(
+                "{}", lambda: self._format_log(ctx, command_type, command_args)
+            )
+            return
+
+        msg = self._format_log(ctx, command_type, command_args)
         # terminal log
         self.bot.logger.info(msg)
         # webhook log
-        if self.bot.log_webhook:
-            self.log_buffer.append(msg)
+        self._log_buf += msg.encode("utf-8")
+        self._log_buf += b"\n"
+        if len(self._log_buf) - self._sent_len > self.BUFFER_LIMIT:
+            self._drop_oldest()
+        self._schedule_flush()
+
+    def _drop_oldest(self) -> None:
+        """
+        Drop the oldest logs not sent yet, down to 3/4 of the buffer limit.
+        This happens when the webhook cannot keep up, e.g. during an outage.
+        This is an internal function and should not be called directly.
+        """
+        start = max(self._sent_len, self._sending_end)
+        excess = len(self._log_buf) - start - self.BUFFER_LIMIT * 3 // 4
+        if excess <= 0:
+            return
+        # cut at a line boundary, the buffer always ends with a newline
+        end = self._log_buf.index(b"\n", start + excess) + 1
+        dropped = self._log_buf.count(b"\n", start, end)
+        del self._log_buf[start:end]
+        self.logger.info(f"Command log buffer overflowed, dropped {dropped} logs")
+
+    def _schedule_flush(self) -> None:
+        """
+        Schedule sending the buffered logs, so a burst of logs is sent by one webhook call.
+        This is an internal function and should not be called directly.
+        """
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+        if len(self._log_buf) - self._sent_len >= self.FLUSH_SIZE:
+            self._flush_event.set()
+            return
+
+        now = time.monotonic()
+        if self._first_buffered_at is None:
+            self._first_buffered_at = now
+        delay = min(self._first_buffered_at + self.FLUSH_MAX_DELAY - now, self.FLUSH_DELAY)
+        self._flush_timer = self.bot.loop.call_later(max(delay, 0), self._flush_event.set)
+
+    @discord.Cog.listener()
+    async def on_guild_channel_update(
+        self, before: discord.abc.GuildChannel, after: discord.abc.GuildChannel
+    ) -> None:
+        """
+        The event that is triggered when a guild channel is updated.
+        """
+        self._ch_prefix.pop(after.id, None)
+
+    @discord.Cog.listener()
+    async def on_thread_update(self, before: discord.Thread, after: discord.Thread) -> None:
+        """
+        The event that is triggered when a thread is updated.
+        """
+        self._ch_prefix.pop(after.id, None)
+
+    @discord.Cog.listener()
+    async def on_guild_update(self, before: discord.Guild, after: discord.Guild) -> None:
+        """
+        The event that is triggered when a guild is updated.
+        """
+        if before.name != after.name:
+            for channel in (*after.channels, *after.threads):
+                self._ch_prefix.pop(channel.id, None)
 
     @discord.Cog.listener()
     async def on_command(self, ctx: commands.Context) -> None:
         """
         The event that is triggered when a message command is used.
         """
-        await self._log_command(ctx, "text", ", ".join(f"{k}: {v}" for k, v in ctx.kwargs))
+        await self._log_command(
+            ctx, "text", ", ".join([f"{k}: {v}" for k, v in ctx.kwargs.items()])
+        )
 
     @discord.Cog.listener()
     async def on_application_command(self, ctx: discord.ApplicationContext) -> None:
         """
         The event that is triggered when an application command is used.
         """
-        command_type = "application"
-        args = ""
-        match ctx.command.type:
-            case 1:
-                command_type = "slash"
-                if (options := ctx.interaction.data.get("options")) is not None:
-                    args = ", ".join(f"{option['name']}: {option['value']}" for option in options)
-            case 2:
-                command_type = "user"
-                args = f"user: {ctx.interaction.data['target_id']}"
-            case 3:
-                command_type = "message"
-                args = f"message: {ctx.interaction.data['target_id']}"
+        command_type, format_args = _APP_FORMATTERS.get(ctx.command.type, _DEFAULT_APP_FORMATTER)
+        args = format_args(ctx.interaction.data)
         await self._log_command(ctx, command_type, args)
 
     @discord.Cog.listener()
@@ -106,31 +260,89 @@ class CmdLogger(BaseCog):
         )
         self.logger.exception(type(error).__name__, exc_info=error)
 
-    @tasks.loop(seconds=10)
     async def _edit_message(self) -> None:
-        if not self.log_buffer:
+        if len(self._log_buf) == self._sent_len:
             return
 
-        buffer = "\n".join(self.log_buffer)
-        self.log_buffer.clear()
-        if len(self.log_content) + len(buffer) >= 1994:  # 2000 (max len) - 6 (code block markdown)
-            self.log_content = buffer
+        # 2000 (max len) - 6 (code block markdown), bytes are never fewer than characters
+        if len(self._log_buf) >= 1994:
+            # start a new message with the logs not sent yet
+            del self._log_buf[: self._sent_len]
+            self._sent_len = 0
             self.message_id = None
-        else:
-            self.log_content += buffer + "\n"
-        # send webhook message
-        async with aiohttp.ClientSession() as session:
-            webhook = discord.Webhook.from_url(self.bot.log_webhook, session=session)
-            if self.message_id is None:
-                message = await webhook.send(f"```{self.log_content}```", wait=True)
-                self.message_id = message.id
-            else:
-                await webhook.edit_message(self.message_id, content=f"```{self.log_content}```")
+        end = len(self._log_buf)
+        if end > 1994:
+            # send as many whole lines as fit, the rest goes to the next message
+            end = self._log_buf.rfind(b"\n", 0, 1994) + 1
+            if not end:
+                # a single line longer than a message, truncate it
+                line_end = self._log_buf.index(b"\n")
+                truncated = (self._log_buf[:1990].decode("utf-8", "ignore") + "...").encode("utf-8")
+                self._log_buf[:line_end] = truncated
+                end = len(truncated) + 1
+        content = self._log_buf[:end].decode("utf-8")
+        self._sending_end = end
+        try:
+            await self._send(content)
+        finally:
+            self._sending_end = 0
+        self._sent_len = end
+        if end < len(self._log_buf):
+            self._flush_event.set()
 
-    @discord.Cog.listener()
-    async def on_ready(self) -> None:
-        if self.bot.log_webhook and not self._edit_message.is_running():
-            self._edit_message.start()
+    async def _send(self, content: str) -> None:
+        """
+        Send the content to the webhook message, retrying on rate limits.
+        This is an internal function and should not be called directly.
+
+        :param content: The content of the message.
+        :type content: str
+        """
+        for attempt in range(self.WEBHOOK_RETRIES + 1):
+            await self._bucket.acquire()
+            try:
+                if self.message_id is None:
+                    message = await self._webhook.send(f"```{content}```", wait=True)
+                    self.message_id = message.id
+                else:
+                    await self._webhook.edit_message(self.message_id, content=f"```{content}```")
+                return
+            except discord.HTTPException as e:
+                if e.status != 429 or attempt == self.WEBHOOK_RETRIES:
+                    raise
+                retry_after = e.response.headers.get("Retry-After")
+                await asyncio.sleep(float(retry_after) if retry_after else 1)
+
+    async def _flusher(self) -> None:
+        """
+        Send the buffered logs to the webhook whenever new logs are buffered.
+        This is an internal function and should not be called directly.
+        """
+        try:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=4, ttl_dns_cache=300, keepalive_timeout=60)
+            )
+            self._webhook.session = self._session
+            while True:
+                await self._flush_event.wait()
+                self._flush_event.clear()
+                self._first_buffered_at = None
+                try:
+                    await self._edit_message()
+                except Exception:
+                    self.logger.exception("Failed to send the command logs to the webhook")
+        finally:
+            if self._session is not None:
+                await self._session.close()
+            self._session = self._webhook = None
+
+    def cog_unload(self) -> None:
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            self._flush_task = None
 
 
 def setup(bot: Bot) -> None:
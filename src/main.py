@@ -4,17 +4,57 @@ The main module of the bot.
 
 import logging
 import shutil
+import sys
 import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
 from typing import Optional
 
 import discord
-import ffmpeg_downloader as ffdl
+import orjson
 from discord.ext import commands
 
 from src.client.config import Config
 from src.client.database import Database
 from src.client.logging import InterceptHandler, Logging
 
+try:
+    import resource
+except ImportError:  # not available on Windows
+    resource = None
+
+
+def _to_json(obj) -> str:
+    """
+    Encode a discord payload with orjson.
+    Non-str keys are converted to strings, like the stdlib json does.
+    This is an internal function and should not be called directly.
+    """
+    return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+
+
+# encode and decode the discord payloads (gateway, http and webhooks) with orjson
+discord.utils._to_json = _to_json
+discord.utils._from_json = orjson.loads
+
+
+def get_memory_usage() -> Optional[float]:
+    """
+    Get the memory usage of the process in MB.
+    It is the peak resident set size if available, else the memory traced by tracemalloc.
+
+    :return: The memory usage in MB or None if it cannot be measured.
+    :rtype: Optional[float]
+    """
+    if resource is not None:
+        max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # bytes on macOS, kilobytes elsewhere
+        return max_rss / 1024**2 if sys.platform == "darwin" else max_rss / 1024
+    if tracemalloc.is_tracing():
+        # only reads the traced size counters, it does not walk the traces like a snapshot
+        return tracemalloc.get_traced_memory()[0] / 1024**2
+    return None
+
 
 class Bot(discord.AutoShardedBot):
     """
@@ -37,20 +77,32 @@ class Bot(discord.AutoShardedBot):
         )
         self.log_webhook = log_webhook
         self.database = Database(self.config["database"]["path"])
-        self.ffmpeg = shutil.which("ffmpeg") or self.config["ffmpeg"]["path"] or ffdl.ffmpeg_path
-        self.ffprobe = (
-            shutil.which("ffprobe") or self.config["ffmpeg"]["ffprobe"] or ffdl.ffprobe_path
+        self.ytdlp_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="ytdlp")
+        # the paths are only resolved here when the debug logs are enabled
+        self.logger.opt(lazy=True).debug(
+            "ffmpeg: {}, ffprobe: {}", lambda: self.ffmpeg, lambda: self.ffprobe
         )
-        print(self.ffmpeg, self.ffprobe)
 
         intents = discord.Intents.default()
-        super().__init__(owner_ids=self.config["bot"]["owners"], intents=intents)
+        intents.typing = False  # typing events are not used, don't receive them
+        super().__init__(
+            owner_ids=self.config["bot"]["owners"],
+            intents=intents,
+            chunk_guilds_at_startup=False,  # no member cache is needed
+        )
 
+    async def start(self, token: str, *, reconnect: bool = True) -> None:
+        """
+        Load the extensions, then log in and connect to Discord.
+        The extensions are loaded here instead of the constructor,
+        but still before connecting so their application commands get synced.
+        """
         for k, v in self.load_extension("src.cogs", recursive=True, store=True).items():
             if v is True:
                 self.logger.debug(f"Loaded extension {k}")
             else:
                 self.logger.error(f"Failed to load extension {k} with exception: {v}")
+        await super().start(token, reconnect=reconnect)
 
     async def on_start(self) -> None:
         """
@@ -58,12 +110,14 @@ class Bot(discord.AutoShardedBot):
         """
         await self.database.initialize()
         self._uptime = discord.utils.utcnow()  # Store a timezone-aware datetime object
+        memory_usage = get_memory_usage()
+        memory_usage = f"{memory_usage:.2f} MB" if memory_usage is not None else "N/A"
         self.logger.info(
             f"""
 -------------------------
 Logged in as: {self.user.name}#{self.user.discriminator} ({self.user.id})
 Shards Count: {self.shard_count}
-Memory Usage: {tracemalloc.get_traced_memory()[0] / 1024 ** 2:.2f} MB
+Memory Usage: {memory_usage}
  API Latency: {self.latency * 1000:.2f} ms
 Guilds Count: {len(self.guilds)}
 -------------------------"""
@@ -80,8 +134,40 @@ Guilds Count: {len(self.guilds)}
 
     async def close(self) -> None:
         self.logger.enable("discord")
+        await self.database.close()
+        self.ytdlp_executor.shutdown(wait=False, cancel_futures=True)
         return await super().close()
 
+    @cached_property
+    def ffmpeg(self) -> str:
+        """
+        The path of the ffmpeg executable, resolved on first use.
+
+        :return: The path of the ffmpeg executable.
+        :rtype: str
+        """
+        if path := shutil.which("ffmpeg") or self.config["ffmpeg"]["path"]:
+            return path
+        # imported here, ffmpeg_downloader is only needed when ffmpeg is not found elsewhere
+        import ffmpeg_downloader as ffdl
+
+        return ffdl.ffmpeg_path
+
+    @cached_property
+    def ffprobe(self) -> str:
+        """
+        The path of the ffprobe executable, resolved on first use.
+
+        :return: The path of the ffprobe executable.
+        :rtype: str
+        """
+        if path := shutil.which("ffprobe") or self.config["ffmpeg"]["ffprobe"]:
+            return path
+        # imported here, ffmpeg_downloader is only needed when ffprobe is not found elsewhere
+        import ffmpeg_downloader as ffdl
+
+        return ffdl.ffprobe_path
+
     @property
     def uptime(self) -> Optional[int]:
         """
@@ -100,6 +186,8 @@ class BaseCog(commands.Cog):
     The base cog class.
     """
 
+    __slots__ = ("bot", "logger")
+
     def __init__(self, bot: Bot) -> None:
         self.bot = bot
         self.logger = bot.logger
@@ -2,6 +2,8 @@
 Discord-related utilities functions for the bot.
 """
 
+import functools
+
 import discord
 
 
@@ -15,6 +17,23 @@ def get_user_name(user: discord.User) -> str:
     :return: The name of the user.
     :rtype: str
     """
-    if user.discriminator == "0":
-        return f"@{user.name}"
-    return f"{user.name}#{user.discriminator}"
+    return _format_user_name(user.name, user.discriminator)
+
+
+@functools.lru_cache(maxsize=4096)
+def _format_user_name(name: str, discriminator: str) -> str:
+    """
+    Format the name of a user, memoized by the name and the discriminator.
+    This is an internal function and should not be called directly.
+
+    :param name: The name of the user.
+    :type name: str
+    :param discriminator: The discriminator of the user.
+    :type discriminator: str
+
+    :return: The name of the user.
+    :rtype: str
+    """
+    if discriminator == "0":
+        return f"@{name}"
+    return f"{name}#{discriminator}"
@@ -0,0 +1,42 @@
+"""
+Rate limiting utilities for the bot.
+"""
+
+import asyncio
+import time
+
+
+class TokenBucket:
+    """
+    An asynchronous token bucket.
+    Holds up to ``capacity`` tokens, refilled at ``rate`` tokens per second.
+    """
+
+    def __init__(self, rate: float, capacity: int) -> None:
+        """
+        Initialize the token bucket, starting full.
+
+        :param rate: The number of tokens refilled per second.
+        :type rate: float
+        :param capacity: The maximum number of tokens.
+        :type capacity: int
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """
+        Take a token, waiting until one is available.
+        """
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
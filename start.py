@@ -4,7 +4,11 @@ Start the application.
 
 import tracemalloc
 
-tracemalloc.start(25)  # Used in src/client/client.py on_ready function.
+from src.client.config import Config
+
+if Config()["bot"]["debug-mode"]:
+    # Tracing slows down every allocation, only enable it for debugging.
+    tracemalloc.start(25)
 
 
 def main():